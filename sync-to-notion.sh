@@ -34,7 +34,7 @@ if [ ! -f "notion/notion-dev-databases.md" ]; then
 fi
 
 echo "🔄 Running multi-database sync..."
-python sync/multi-db-notion-sync.py
+python sync/prompt-sync.py --sink notion-multi
 
 # If the script was run from GitHub Actions
 if [ "$CI" = "true" ]; then
@@ -0,0 +1,539 @@
+#!/usr/bin/env python3
+"""
+Prompt Sync - One-way sync from Git to one or more sinks
+Git is the source of truth. Every sink is a read-only viewer.
+
+Prompts are scanned and mapped once, then fanned out to each selected sink:
+  notion        Single Notion database (NOTION_DATABASE_ID)
+  notion-multi  Multiple Notion databases, routed by the `target_db` field
+  file          JSON or JSONL export (format picked from the file extension)
+  null          Discards everything; useful for timing the scan/map stage
+
+Each sink declares its own batch size and worker count.
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Iterator, Tuple
+import frontmatter
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+NOTION_API_KEY = os.getenv('NOTION_API_KEY')
+NOTION_DATABASE_ID = os.getenv('NOTION_DATABASE_ID', '2bedbdf10e314b638e3fc21d7aa8b373')
+GITHUB_REPO = os.getenv('GITHUB_REPO', 'harrysayers7/prompt-library')
+GITHUB_BRANCH = os.getenv('GITHUB_BRANCH', 'main')
+
+# Load database IDs from notion/notion-dev-databases.md
+DATABASE_CONFIG_PATH = Path('notion/notion-dev-databases.md')
+DEFAULT_TARGET_DB = 'Prompt Library'
+
+# Mapping configurations that apply to all databases
+CATEGORY_MAP = {
+    'coding': 'Technical',
+    'writing': 'Writing',
+    'analysis': 'Analysis',
+    'design': 'Creative',
+    'support': 'Communication',
+    'research': 'Research',
+    'business': 'Business'
+}
+
+PERFORMANCE_MAP = {
+    'high': 'Excellent',
+    'medium': 'Good',
+    'low': 'Fair',
+    'unknown': 'Needs Work'
+}
+
+AI_MODEL_MAP = {
+    'gpt-4': 'GPT-4',
+    'gpt-3.5': 'GPT-3.5',
+    'claude-3': 'Claude',
+    'claude-3.5': 'Claude',
+    'gemini': 'Gemini'
+}
+
+_notion = None
+_notion_lock = threading.Lock()
+
+
+def get_notion_client():
+    """Create the shared Notion client on first use"""
+    global _notion
+    with _notion_lock:
+        if _notion is None:
+            from notion_client import Client
+            _notion = Client(auth=NOTION_API_KEY)
+    return _notion
+
+
+def load_database_config():
+    """Load database IDs from the notion-dev-databases.md file"""
+    if not DATABASE_CONFIG_PATH.exists():
+        print(f"❌ Database config file not found at {DATABASE_CONFIG_PATH}")
+        sys.exit(1)
+
+    databases = {}
+    current_db = None
+
+    with open(DATABASE_CONFIG_PATH, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('**Notion Dev Database IDs List:**'):
+                continue
+
+            # New database entry starts with "**Database Name**"
+            if line.startswith('**') and not line.startswith('* **'):
+                current_db = line.strip('*').strip()
+                databases[current_db] = {}
+
+            # Database ID or Data Source ID
+            elif line.startswith('* **Database ID'):
+                value = line.split('`')[1]
+                databases[current_db]['database_id'] = value
+            elif line.startswith('* **Data Source ID'):
+                value = line.split('`')[1]
+                databases[current_db]['data_source_id'] = value
+
+    return databases
+
+
+def map_ai_models(tested_with: List[str]) -> str:
+    """Map tested_with models to Notion AI Model options"""
+    for model in tested_with:
+        model_lower = model.lower()
+        for key, value in AI_MODEL_MAP.items():
+            if key in model_lower:
+                return value
+    return 'Universal'  # Default if no specific model found
+
+
+def build_notion_properties(prompt: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a scanned prompt onto the Notion database properties"""
+
+    # Map category
+    category = CATEGORY_MAP.get(prompt['category'], 'Technical')
+
+    # Map performance to effectiveness rating
+    effectiveness = PERFORMANCE_MAP.get(prompt['performance'], 'Good')
+
+    # Map AI models
+    ai_model = map_ai_models(prompt['tested_with'])
+
+    # Combine use_when and avoid_when for Use Case
+    use_case = f"Use when: {prompt['use_when']}\n\nAvoid when: {prompt['avoid_when']}" if prompt['use_when'] or prompt['avoid_when'] else ""
+
+    # Add GitHub URL and version to Notes
+    notes = f"Version: {prompt['version']}\nGitHub: {prompt['github_url']}"
+
+    return {
+        'Prompt Name': {
+            'title': [{'text': {'content': prompt['name']}}]
+        },
+        'Prompt Text': {
+            'rich_text': [{'text': {'content': prompt['content'][:2000]}}]  # Notion limit
+        },
+        'Description': {
+            'rich_text': [{'text': {'content': prompt['description'][:2000]}}]
+        },
+        'Category': {
+            'select': {'name': category}
+        },
+        'Tags': {
+            'multi_select': [{'name': tag} for tag in prompt['tags'][:9]]  # Limit to match your options
+        },
+        'AI Model': {
+            'select': {'name': ai_model}
+        },
+        'Effectiveness Rating': {
+            'select': {'name': effectiveness}
+        },
+        'Use Case': {
+            'rich_text': [{'text': {'content': use_case[:2000]}}]
+        },
+        'Status': {
+            'select': {'name': 'Active'}
+        },
+        'Notes': {
+            'rich_text': [{'text': {'content': notes[:2000]}}]
+        },
+        'Favorite': {
+            'checkbox': prompt['performance'] == 'high'  # Auto-favorite high performance prompts
+        }
+    }
+
+
+def chunked(items: List[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive slices of at most `size` items"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class Sink(ABC):
+    """
+    Base class for sync targets.
+
+    The engine calls open() once with every mapped prompt, then
+    write_batch() for each slice of `batch_size` prompts on up to
+    `max_workers` threads, then close(). write_batch() returns a
+    (synced, errors) tuple. Sinks with max_workers > 1 must be safe
+    to call from worker threads.
+    """
+    name = 'sink'
+    batch_size = 1
+    max_workers = 1
+
+    def describe(self) -> str:
+        return self.name
+
+    def open(self, prompts: List[Dict[str, Any]]):
+        pass
+
+    @abstractmethod
+    def write_batch(self, batch: List[Dict[str, Any]]) -> Tuple[int, int]:
+        pass
+
+    def close(self):
+        pass
+
+
+class NotionSink(Sink):
+    """Base for Notion targets: one API call per prompt"""
+    batch_size = 1
+    # Notion allows ~3 requests/second and notion-client does not retry on
+    # rate_limited, so requests go out one at a time and in order
+    max_workers = 1
+
+    def get_existing_pages(self, database_id: str) -> Dict[str, str]:
+        """Get all existing pages from a specific Notion database"""
+        notion = get_notion_client()
+        existing = {}
+
+        try:
+            query = {'database_id': database_id, 'page_size': 100}
+            while True:
+                response = notion.databases.query(**query)
+
+                for page in response['results']:
+                    # Get the prompt name to match
+                    title_prop = page['properties'].get('Prompt Name', {}) or page['properties'].get('Name', {})
+                    if title_prop.get('title'):
+                        title_text = title_prop['title'][0].get('text', {}).get('content', '')
+                        if title_text:
+                            existing[title_text] = page['id']
+
+                if not response.get('has_more'):
+                    break
+                query['start_cursor'] = response['next_cursor']
+
+        except Exception as e:
+            print(f"  ✗ Error fetching Notion pages: {e}")
+
+        return existing
+
+    def create_or_update_page(self, prompt: Dict[str, Any], database_id: str, db_name: str,
+                              page_id: str = None) -> bool:
+        """Create or update a Notion page for a prompt in the specified database"""
+        notion = get_notion_client()
+
+        try:
+            if page_id:
+                # Update existing page
+                notion.pages.update(
+                    page_id=page_id,
+                    properties=prompt['notion_properties']
+                )
+                print(f"    ✓ Updated: {prompt['name']} in {db_name}")
+            else:
+                # Create new page
+                notion.pages.create(
+                    parent={'database_id': database_id},
+                    properties=prompt['notion_properties']
+                )
+                print(f"    ✓ Created: {prompt['name']} in {db_name}")
+            return True
+
+        except Exception as e:
+            print(f"    ✗ Error syncing {prompt['name']}: {e}")
+            return False
+
+
+class NotionSingleDatabaseSink(NotionSink):
+    """Sync every prompt into a single Notion database"""
+    name = 'notion'
+
+    def __init__(self, database_id: str = NOTION_DATABASE_ID, db_name: str = DEFAULT_TARGET_DB):
+        self.database_id = database_id
+        self.db_name = db_name
+        self.existing_pages = {}
+
+    def describe(self) -> str:
+        return f"Notion database (ID: {self.database_id})"
+
+    def open(self, prompts):
+        self.existing_pages = self.get_existing_pages(self.database_id)
+        print(f"   Found {len(self.existing_pages)} existing pages")
+
+    def write_batch(self, batch):
+        synced = errors = 0
+        for prompt in batch:
+            # Match by name
+            page_id = self.existing_pages.get(prompt['name'])
+            if self.create_or_update_page(prompt, self.database_id, self.db_name, page_id):
+                synced += 1
+            else:
+                errors += 1
+        return synced, errors
+
+
+class NotionMultiDatabaseSink(NotionSink):
+    """Route each prompt to the Notion database named by its `target_db` field"""
+    name = 'notion-multi'
+
+    def __init__(self):
+        self.database_config = load_database_config()
+        self.existing_pages = {}
+
+    def describe(self) -> str:
+        return f"{len(self.database_config)} Notion databases"
+
+    def open(self, prompts):
+        # Organize prompts by target database
+        counts = {}
+        for prompt in prompts:
+            counts[prompt['target_db']] = counts.get(prompt['target_db'], 0) + 1
+
+        for db_name, count in counts.items():
+            if db_name not in self.database_config:
+                print(f"⚠️ Warning: Target database '{db_name}' not found in config. Skipping {count} prompts.")
+                continue
+
+            db_id = self.database_config[db_name]['database_id']
+            print(f"   Database: {db_name} (ID: {db_id}), {count} prompts")
+            self.existing_pages[db_name] = self.get_existing_pages(db_id)
+            print(f"   Found {len(self.existing_pages[db_name])} existing pages")
+
+    def write_batch(self, batch):
+        synced = errors = 0
+        for prompt in batch:
+            db_name = prompt['target_db']
+            if db_name not in self.existing_pages:
+                continue
+
+            db_id = self.database_config[db_name]['database_id']
+            # Match by name
+            page_id = self.existing_pages[db_name].get(prompt['name'])
+            if self.create_or_update_page(prompt, db_id, db_name, page_id):
+                synced += 1
+            else:
+                errors += 1
+        return synced, errors
+
+
+class FileSink(Sink):
+    """Export prompts to a JSON array or, for *.jsonl paths, one object per line"""
+    name = 'file'
+    batch_size = 500
+    max_workers = 1  # Single file handle; batches must be written in order
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.jsonl = self.path.suffix == '.jsonl'
+        self.handle = None
+        self.first = True
+        self.written = 0
+
+    def describe(self) -> str:
+        return f"{'JSONL' if self.jsonl else 'JSON'} file ({self.path})"
+
+    def open(self, prompts):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.handle = open(self.path, 'w', encoding='utf-8')
+        if not self.jsonl:
+            self.handle.write('[\n')
+
+    def write_batch(self, batch):
+        for prompt in batch:
+            record = {k: v for k, v in prompt.items() if k != 'notion_properties'}
+            line = json.dumps(record, ensure_ascii=False, default=str)
+            if self.jsonl:
+                self.handle.write(line + '\n')
+            else:
+                self.handle.write(('' if self.first else ',\n') + '  ' + line)
+                self.first = False
+            self.written += 1
+        return len(batch), 0
+
+    def close(self):
+        if self.handle:
+            if not self.jsonl:
+                self.handle.write('\n]\n')
+            self.handle.close()
+            self.handle = None
+            print(f"   Wrote {self.written} prompts to {self.path}")
+
+
+class NullSink(Sink):
+    """Accept and discard every prompt"""
+    name = 'null'
+    batch_size = 1000
+    max_workers = 1
+
+    def write_batch(self, batch):
+        return len(batch), 0
+
+
+SINKS = {
+    'notion': NotionSingleDatabaseSink,
+    'notion-multi': NotionMultiDatabaseSink,
+    'file': FileSink,
+    'null': NullSink,
+}
+
+
+class PromptSync:
+    def __init__(self, sinks: List[Sink]):
+        self.prompts_dir = Path('prompts')
+        self.sinks = sinks
+        self.prompt_count = 0
+        self.scan_errors = 0
+        self.sink_results = []
+
+    def get_all_prompts(self) -> List[Dict[str, Any]]:
+        """Scan directory for all prompt files"""
+        prompts = []
+
+        for md_file in self.prompts_dir.glob('**/*.md'):
+            if md_file.name.startswith('_'):
+                continue
+
+            try:
+                with open(md_file, 'r', encoding='utf-8') as f:
+                    post = frontmatter.load(f)
+
+                # Calculate unique ID from file path
+                relative_path = md_file.relative_to(self.prompts_dir)
+                prompt_id = str(relative_path).replace('.md', '').replace('\\', '/')
+
+                prompt_data = {
+                    'id': prompt_id,
+                    'path': str(md_file),
+                    'github_url': f"https://github.com/{GITHUB_REPO}/blob/{GITHUB_BRANCH}/prompts/{relative_path}",
+                    'name': post.metadata.get('name', md_file.stem),
+                    'description': post.metadata.get('description', ''),
+                    'category': post.metadata.get('category', 'uncategorized'),
+                    'tags': post.metadata.get('tags', []),
+                    'version': post.metadata.get('version', '1.0.0'),
+                    'tested_with': post.metadata.get('tested_with', []),
+                    'performance': post.metadata.get('performance', 'unknown'),
+                    'use_when': post.metadata.get('use_when', ''),
+                    'avoid_when': post.metadata.get('avoid_when', ''),
+                    'content': post.content,
+                    'content_hash': hashlib.md5(post.content.encode()).hexdigest(),
+                    'target_db': post.metadata.get('target_db', DEFAULT_TARGET_DB)  # Default to main prompt library
+                }
+                prompt_data['notion_properties'] = build_notion_properties(prompt_data)
+
+                prompts.append(prompt_data)
+                print(f"  ✓ Found: {prompt_id}")
+
+            except Exception as e:
+                print(f"  ✗ Error reading {md_file}: {e}")
+                self.scan_errors += 1
+
+        return prompts
+
+    def run_sink(self, sink: Sink, prompts: List[Dict[str, Any]]):
+        """Push every prompt through one sink using its batching and concurrency"""
+        print(f"\n🔄 Syncing to {sink.describe()}...")
+        print(f"   Batch size: {sink.batch_size}, workers: {sink.max_workers}")
+        started = time.perf_counter()
+        synced = errors = 0
+
+        # A failing sink is counted against itself; the remaining sinks still run
+        try:
+            sink.open(prompts)
+            try:
+                batches = chunked(prompts, sink.batch_size)
+                if sink.max_workers > 1:
+                    with ThreadPoolExecutor(max_workers=sink.max_workers) as pool:
+                        results = pool.map(sink.write_batch, batches)
+                        for batch_synced, batch_errors in results:
+                            synced += batch_synced
+                            errors += batch_errors
+                else:
+                    for batch in batches:
+                        batch_synced, batch_errors = sink.write_batch(batch)
+                        synced += batch_synced
+                        errors += batch_errors
+            finally:
+                sink.close()
+        except Exception as e:
+            print(f"   ✗ Error in {sink.name} sink: {e}")
+            errors += 1
+
+        self.sink_results.append((sink, synced, errors))
+        print(f"   {sink.name}: {synced} synced, {errors} errors in {time.perf_counter() - started:.2f}s")
+
+    def sync(self):
+        """Main sync process: one scan, fanned out to every sink"""
+        print("\n🚀 Starting Prompt Sync...")
+        print(f"   Source: Git repository")
+        print(f"   Targets: {', '.join(sink.describe() for sink in self.sinks)}\n")
+
+        # Get all prompts from git
+        print("📂 Scanning for prompts...")
+        started = time.perf_counter()
+        prompts = self.get_all_prompts()
+        self.prompt_count = len(prompts)
+        print(f"   Found {len(prompts)} prompts in {time.perf_counter() - started:.2f}s")
+
+        for sink in self.sinks:
+            self.run_sink(sink, prompts)
+
+        # Summary
+        print(f"\n✅ Sync Complete!")
+        print(f"   Scanned: {self.prompt_count} prompts")
+        if self.scan_errors > 0:
+            print(f"   Read errors: {self.scan_errors} (check logs)")
+        for sink, synced, errors in self.sink_results:
+            print(f"   {sink.describe()}: {synced} synced" + (f", {errors} errors (check logs)" if errors else ""))
+        print(f"\n📝 Remember: Always edit in Git, never in Notion!\n")
+
+
+def build_sinks(names: List[str], output: str) -> List[Sink]:
+    """Instantiate the sinks selected on the command line"""
+    if any(issubclass(SINKS[name], NotionSink) for name in names) and not NOTION_API_KEY:
+        print("❌ Missing NOTION_API_KEY in .env file")
+        sys.exit(1)
+
+    sinks = []
+    for name in names:
+        if name == 'file':
+            sinks.append(FileSink(output))
+        else:
+            sinks.append(SINKS[name]())
+    return sinks
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Sync prompts from Git to one or more sinks')
+    parser.add_argument('--sink', action='append', choices=sorted(SINKS),
+                        help='Sink to sync to; repeat to fan out to several (default: notion)')
+    parser.add_argument('--output', default='prompts.jsonl',
+                        help='Output path for the file sink (.jsonl for JSON Lines, otherwise JSON)')
+    args = parser.parse_args()
+
+    syncer = PromptSync(build_sinks(args.sink or ['notion'], args.output))
+    syncer.sync()